@@ -2,7 +2,9 @@
 This module provides a helper class to deal with fills (for shapes, table cells ...) in python-pptx.
 @author: Nathanael Jöhrmann
 """
+import logging
 from enum import Enum, auto
+from functools import lru_cache
 from typing import Union, Optional, Tuple
 
 from pptx.dml.color import RGBColor
@@ -11,7 +13,9 @@ from pptx.enum.base import EnumValue
 from pptx.enum.dml import MSO_THEME_COLOR_INDEX
 from pptx.enum.dml import MSO_PATTERN_TYPE
 
-from pptx_tools.utils import _DO_NOT_CHANGE
+from pptx_tools.utils import _DO_NOT_CHANGE, _ReadOnlyStyle
+
+_log = logging.getLogger(__name__)
 
 
 class FillType(Enum):
@@ -21,7 +25,45 @@ class FillType(Enum):
     GRADIENT = auto()  # fill.gradient(); not implemented jet
 
 
+@lru_cache(maxsize=256, typed=True)
+def _rgb_from_tuple(r, g, b) -> RGBColor:
+    """Shared RGBColor instances for the (usually small) palette of a presentation; RGBColor is immutable."""
+    return RGBColor(r, g, b)
+
+
+def _rgb_from_values(value: Tuple[any, any, any]) -> RGBColor:
+    """RGBColor(*value), using the shared instances of _rgb_from_tuple when possible."""
+    try:
+        return _rgb_from_tuple(*value)
+    except TypeError:  # e.g. unhashable components - let RGBColor() validate them, as without the cache
+        return RGBColor(*value)
+
+
+# converters used by the *_rgb setters; looked up by type(value) to avoid isinstance() chains on every assignment
+_RGB_CONVERTERS = {
+    tuple: _rgb_from_values,
+    RGBColor: lambda value: value,
+    type(None): lambda value: None,
+}
+
+
+def _to_rgb_color(value: Union[RGBColor, Tuple[any, any, any], None]) -> Optional[RGBColor]:
+    """Convert value to RGBColor (or None). Raises TypeError for unsupported types."""
+    try:
+        return _RGB_CONVERTERS[type(value)](value)
+    except KeyError:  # subclasses (e.g. of RGBColor or namedtuples) are not in the table
+        if isinstance(value, RGBColor):
+            return value
+        if isinstance(value, tuple):
+            return _rgb_from_values(value)
+        raise TypeError(f"Expected RGBColor, tuple or None, got {type(value).__name__}") from None
+
+
 class PPTXFillStyle:
+    __slots__ = ('fill_type', '_fore_color_rgb', '_fore_color_mso_theme', 'fore_color_brightness',
+                 '_back_color_rgb', '_back_color_mso_theme', 'back_color_brightness', 'pattern',
+                 '_has_fore_color', '_has_back_color')
+
     def __init__(self):
         self.fill_type: Optional[FillType] = None  # FillType.SOLID
         self._fore_color_rgb: Union[RGBColor, Tuple[float, float, float], None] = None
@@ -34,6 +76,10 @@ class PPTXFillStyle:
 
         self.pattern: Optional[MSO_PATTERN_TYPE] = None  # 0 ... 47
 
+        # kept up to date by the color setters, so write_fill() does not have to re-check both color definitions
+        self._has_fore_color: bool = False
+        self._has_back_color: bool = False
+
     @property
     def fore_color_rgb(self) -> Optional[RGBColor]:
         return self._fore_color_rgb
@@ -53,37 +99,35 @@ class PPTXFillStyle:
 
     @fore_color_rgb.setter
     def fore_color_rgb(self, value: Union[RGBColor, Tuple[any, any, any], None]):
+        self._fore_color_rgb = _to_rgb_color(value)
         if value is not None:
-            assert isinstance(value, RGBColor) or isinstance(value, tuple)
             self._fore_color_mso_theme = None  # only one color definition at a time!
-        if isinstance(value, tuple):
-            self._fore_color_rgb = RGBColor(*value)
-        else:
-            self._fore_color_rgb = value
+        self._has_fore_color = value is not None or self._fore_color_mso_theme is not None
 
     @fore_color_mso_theme.setter
     def fore_color_mso_theme(self, value: Optional[EnumValue]):
         if value is not None:
-            assert isinstance(value, EnumValue)
+            if __debug__ and not isinstance(value, EnumValue):
+                raise TypeError(f"Expected EnumValue or None, got {type(value).__name__}")
             self._fore_color_rgb = None  # only one color definition at a time!
         self._fore_color_mso_theme = value
+        self._has_fore_color = value is not None or self._fore_color_rgb is not None
 
     @back_color_rgb.setter
     def back_color_rgb(self, value: Union[RGBColor, Tuple[any, any, any], None]):
+        self._back_color_rgb = _to_rgb_color(value)
         if value is not None:
-            assert isinstance(value, RGBColor) or isinstance(value, tuple)
-            self._fore_color_mso_theme = None  # only one color definition at a time!
-        if isinstance(value, tuple):
-            self._back_color_rgb = RGBColor(*value)
-        else:
-            self._back_color_rgb = value
+            self._back_color_mso_theme = None  # only one color definition at a time!
+        self._has_back_color = value is not None or self._back_color_mso_theme is not None
 
     @back_color_mso_theme.setter
     def back_color_mso_theme(self, value: Optional[EnumValue]):
         if value is not None:
-            assert isinstance(value, EnumValue)
+            if __debug__ and not isinstance(value, EnumValue):
+                raise TypeError(f"Expected EnumValue or None, got {type(value).__name__}")
             self._back_color_rgb = None  # only one color definition at a time!
         self._back_color_mso_theme = value
+        self._has_back_color = value is not None or self._back_color_rgb is not None
 
     def set(self, fill_type: FillType =_DO_NOT_CHANGE,
                  fore_color_rgb: Union[RGBColor, Tuple[any, any, any], None] = _DO_NOT_CHANGE,
@@ -95,70 +139,111 @@ class PPTXFillStyle:
                  pattern: Optional[MSO_PATTERN_TYPE] = _DO_NOT_CHANGE
                  ):
         """Convenience method to set several fill attributes together."""
-        if fill_type is not _DO_NOT_CHANGE:
+        _NC = _DO_NOT_CHANGE
+        if fill_type is not _NC:
             self.fill_type = fill_type
 
-        if fore_color_rgb is not _DO_NOT_CHANGE:
+        if fore_color_rgb is not _NC:
             self.fore_color_rgb = fore_color_rgb
-        if fore_color_mso_theme is not _DO_NOT_CHANGE:
+        if fore_color_mso_theme is not _NC:
             self.fore_color_mso_theme = fore_color_mso_theme
-        if fore_color_brightness is not _DO_NOT_CHANGE:
+        if fore_color_brightness is not _NC:
             self.fore_color_brightness = fore_color_brightness
 
-        if back_color_rgb is not _DO_NOT_CHANGE:
+        if back_color_rgb is not _NC:
             self.back_color_rgb = back_color_rgb
-        if back_color_mso_theme is not _DO_NOT_CHANGE:
+        if back_color_mso_theme is not _NC:
             self.back_color_mso_theme = back_color_mso_theme
-        if back_color_brightness is not _DO_NOT_CHANGE:
+        if back_color_brightness is not _NC:
             self.back_color_brightness = back_color_brightness
 
-        if pattern is not _DO_NOT_CHANGE:
+        if pattern is not _NC:
             self.pattern = pattern
 
+    def copy(self) -> 'PPTXFillStyle':
+        """Returns a copy of this fill style (cheaper than creating a new style and setting all attributes)."""
+        return self._copy_into(type(self).__new__(type(self)))
+
+    def _copy_into(self, result: 'PPTXFillStyle') -> 'PPTXFillStyle':
+        result.fill_type = self.fill_type
+        result._fore_color_rgb = self._fore_color_rgb
+        result._fore_color_mso_theme = self._fore_color_mso_theme
+        result.fore_color_brightness = self.fore_color_brightness
+        result._back_color_rgb = self._back_color_rgb
+        result._back_color_mso_theme = self._back_color_mso_theme
+        result.back_color_brightness = self.back_color_brightness
+        result.pattern = self.pattern
+        result._has_fore_color = self._has_fore_color
+        result._has_back_color = self._has_back_color
+        return result
+
     def write_fill(self, fill: FillFormat):
         """Write attributes to a FillFormat object."""
-        if self.fill_type is not None:
-            self._write_fill_type(fill)
-
-    def _write_fore_color(self, fill: FillFormat):
-        if self.fore_color_rgb is not None:
-            fill.fore_color.rgb = self.fore_color_rgb
-        elif self.fore_color_mso_theme is not None:
-            fill.fore_color.theme_color = self.fore_color_mso_theme
+        if self.fill_type is None:
+            return
+        if not isinstance(self.fill_type, FillType):
+            raise ValueError(f"Invalid fill_type {self.fill_type!r}; expected a FillType.")
+        self._WRITERS[self.fill_type](self, fill)
+
+    def _apply_fore_color(self, fill: FillFormat):
+        """Write fore color to fill. Callers have to check _has_fore_color first."""
+        if self._fore_color_rgb is not None:
+            fill.fore_color.rgb = self._fore_color_rgb
         else:
-            raise ValueError("No valid rgb_color set")
+            fill.fore_color.theme_color = self._fore_color_mso_theme
         if self.fore_color_brightness:
             fill.fore_color.brightness = self.fore_color_brightness
 
-    def _write_back_color(self, fill: FillFormat):
-        if self.back_color_rgb is not None:
-            fill.back_color.rgb = self.back_color_rgb
-        elif self.back_color_mso_theme is not None:
-            fill.back_color.theme_color = self.back_color_mso_theme
+    def _apply_back_color(self, fill: FillFormat):
+        """Write back color to fill. Callers have to check _has_back_color first."""
+        if self._back_color_rgb is not None:
+            fill.back_color.rgb = self._back_color_rgb
         else:
-            raise ValueError("No valid rgb_color set")
+            fill.back_color.theme_color = self._back_color_mso_theme
         if self.back_color_brightness:
             fill.back_color.brightness = self.back_color_brightness
 
-    def _write_fill_type(self, fill: FillFormat):
-        if self.fill_type == FillType.NOFILL:
-            fill.background()
-
-        elif self.fill_type == FillType.SOLID:
-            if (self.fore_color_rgb is not None) or (self.fore_color_mso_theme is not None):
-                fill.solid()
-                self._write_fore_color(fill)
-            else:
-                print("Warning: Cannot set FillType.SOLID without a valid fore_color_*.")
-
-        elif self.fill_type == FillType.PATTERNED:
-            fill.patterned()
-            if self.pattern is not None:
-                fill.pattern = self.pattern
-            if (self.fore_color_rgb is not None) or (self.fore_color_mso_theme is not None):
-                self._write_fore_color(fill)
-            if (self.back_color_rgb is not None) or (self.back_color_mso_theme is not None):
-                self._write_back_color(fill)
-
-        elif self.fill_type == FillType.GRADIENT:
-            print("FillType.GRADIENT not implemented jet.")
+    def _write_nofill(self, fill: FillFormat):
+        fill.background()
+
+    def _write_solid(self, fill: FillFormat):
+        if self._has_fore_color:
+            fill.solid()
+            self._apply_fore_color(fill)
+        else:
+            _log.warning("Cannot set FillType.SOLID without a valid fore_color_*.")
+
+    def _write_patterned(self, fill: FillFormat):
+        fill.patterned()
+        if self.pattern is not None:
+            fill.pattern = self.pattern
+        if self._has_fore_color:
+            self._apply_fore_color(fill)
+        if self._has_back_color:
+            self._apply_back_color(fill)
+
+    def _write_gradient(self, fill: FillFormat):
+        _log.warning("FillType.GRADIENT not implemented jet.")
+
+    # one writer per FillType; class level (unbound functions), so instances don't carry a dict of bound methods
+    _WRITERS = {
+        FillType.NOFILL: _write_nofill,
+        FillType.SOLID: _write_solid,
+        FillType.PATTERNED: _write_patterned,
+        FillType.GRADIENT: _write_gradient,
+    }
+
+
+class _FrozenFillStyle(_ReadOnlyStyle, PPTXFillStyle):
+    """Read-only PPTXFillStyle, used for DEFAULT_FILL_STYLE."""
+    __slots__ = ('_frozen',)
+    _display_name = "DEFAULT_FILL_STYLE"
+    _mutable_class = PPTXFillStyle
+
+    def __init__(self):
+        super().__init__()
+        self._freeze()
+
+
+# shared style with all attributes unset; use DEFAULT_FILL_STYLE.copy() to get a modifiable style
+DEFAULT_FILL_STYLE = _FrozenFillStyle()
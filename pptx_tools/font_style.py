@@ -14,8 +14,10 @@ from pptx.text.text import _Run
 from pptx.util import Pt
 
 from pptx_tools.enumerations import TEXT_CAPS_VALUES, TEXT_STRIKE_VALUES
-from pptx_tools.fill_style import PPTXFillStyle
-from pptx_tools.utils import _USE_DEFAULT, _DO_NOT_CHANGE
+from pptx_tools.fill_style import PPTXFillStyle, _to_rgb_color
+from pptx_tools.utils import _USE_DEFAULT, _DO_NOT_CHANGE, _ReadOnlyStyle
+
+_MSO_LANG_NONE = MSO_LANGUAGE_ID.NONE  # written for language_id = use_default()
 
 
 class PPTXFontStyle:
@@ -24,6 +26,10 @@ class PPTXFontStyle:
     always needs an existing Text/Character/... for initializing and also basic functionality like assignment
     of one paragraph to another is missing.
     """
+    # '__dict__' is only used for instance values of the class attributes language_id and name
+    __slots__ = ('_bold', '_italic', '_underline', '_size', '_size_emu', '_plan', '_plan_dirty',
+                 '_color_rgb', 'fill_style', 'caps', 'strikethrough', '__dict__')
+
     # default language and paragraph; no _USE_DEFAULT for language_id -> use MSO_LANGUAGE_ID.NONE
     language_id: Union[MSO_LANGUAGE_ID, _USE_DEFAULT, None] = MSO_LANGUAGE_ID.ENGLISH_UK  # MSO_LANGUAGE_ID.GERMAN
     name: Union[str, _USE_DEFAULT, None] = "Roboto"  # "Arial"  # "Arial Narrow"
@@ -31,17 +37,21 @@ class PPTXFontStyle:
     def __init__(self):
         #  If set to use_default(), the bold, italic ... setting is cleared and is inherited
         #  from an enclosing shape’s setting, or a setting in a style or master
-        self.bold: Union[bool, _USE_DEFAULT, None] = None
-        self.italic: Union[bool, _USE_DEFAULT, None] = None
-        self.underline: Union[MSO_TEXT_UNDERLINE_TYPE, _USE_DEFAULT, bool, None] = None
+        self._bold: Union[bool, _USE_DEFAULT, None] = None
+        self._italic: Union[bool, _USE_DEFAULT, None] = None
+        self._underline: Union[MSO_TEXT_UNDERLINE_TYPE, _USE_DEFAULT, bool, None] = None
 
         # use class attribute; instance attribute only when changed by user
         # self.language_id: MSO_LANGUAGE_ID = MSO_LANGUAGE_ID.NONE  # ENGLISH_UK; ENGLISH_US; ESTONIAN; GERMAN; ...
         # self.name: Union[str, _USE_DEFAULT, None] = None
 
-        # saved in units of Pt (not EMU like pptx.text.text.Font) - converting to EMU is done during write_to_font
-        self.size: Optional[int] = None  # 18
+        # saved in units of Pt (not EMU like pptx.text.text.Font) - converted EMU value is cached in _size_emu
+        self._size: Union[int, _USE_DEFAULT, None] = None  # 18
+        self._size_emu: Optional[Pt] = None
 
+        # (attribute, value) pairs written by write_font(); rebuilt only after bold, italic, underline or size changed
+        self._plan: Tuple[Tuple[str, any], ...] = ()
+        self._plan_dirty: bool = True
 
         # todo: color is ColorFormat object
         self._color_rgb: Optional[RGBColor] = None
@@ -52,28 +62,80 @@ class PPTXFontStyle:
         self.caps: Optional[TEXT_CAPS_VALUES] = None
         self.strikethrough: Optional[TEXT_STRIKE_VALUES] = None
 
+    @property
+    def bold(self) -> Union[bool, _USE_DEFAULT, None]:
+        return self._bold
+
+    @bold.setter
+    def bold(self, value: Union[bool, _USE_DEFAULT, None]):
+        self._bold = value
+        self._plan_dirty = True
+
+    @property
+    def italic(self) -> Union[bool, _USE_DEFAULT, None]:
+        return self._italic
+
+    @italic.setter
+    def italic(self, value: Union[bool, _USE_DEFAULT, None]):
+        self._italic = value
+        self._plan_dirty = True
+
+    @property
+    def underline(self) -> Union[MSO_TEXT_UNDERLINE_TYPE, _USE_DEFAULT, bool, None]:
+        return self._underline
+
+    @underline.setter
+    def underline(self, value: Union[MSO_TEXT_UNDERLINE_TYPE, _USE_DEFAULT, bool, None]):
+        self._underline = value
+        self._plan_dirty = True
+
+    @property
+    def size(self) -> Union[int, _USE_DEFAULT, None]:
+        return self._size
+
+    @size.setter
+    def size(self, value: Union[int, _USE_DEFAULT, None]):
+        self._size = value
+        self._size_emu = Pt(value) if value is not None and value is not _USE_DEFAULT else None
+        self._plan_dirty = True
+
     @property
     def color_rgb(self):
         return self._color_rgb
 
     @color_rgb.setter
     def color_rgb(self, value: Union[RGBColor, Tuple[any, any, any], None]):
-        assert isinstance(value, RGBColor) or isinstance(value, tuple) or (value is None)
-        if isinstance(value, tuple):
-            self._color_rgb = RGBColor(*value)
-        else:
-            self._color_rgb = value
+        self._color_rgb = _to_rgb_color(value)
 
 
+    def copy(self) -> 'PPTXFontStyle':
+        """Returns a copy of this font style (cheaper than creating a new style and setting all attributes)."""
+        return self._copy_into(type(self).__new__(type(self)))
+
+    def _copy_into(self, result: 'PPTXFontStyle') -> 'PPTXFontStyle':
+        result._bold = self._bold
+        result._italic = self._italic
+        result._underline = self._underline
+        result._size = self._size
+        result._size_emu = self._size_emu
+        result._plan = self._plan
+        result._plan_dirty = self._plan_dirty
+        result._color_rgb = self._color_rgb
+        result.fill_style = None if self.fill_style is None else self.fill_style.copy()
+        result.caps = self.caps
+        result.strikethrough = self.strikethrough
+        result.__dict__.update(self.__dict__)  # instance values of language_id and name
+        return result
+
     def read_font(self, font: Font) -> 'PPTXFontStyle':  # todo: check for None behavior (use_dfault() ? )
         """Read attributes from a pptx.text.text.Font object."""
         self.bold = font.bold
         self.italic = font.italic
         self.name = font.name
-        if font.size is None:
-            self.size = None
-        else:
-            self.size = font.size.pt
+        size = font.size  # keep the EMU value, so write_font() writes back exactly what was read
+        self._size = None if size is None else size.pt
+        self._size_emu = size
+        self._plan_dirty = True
         self.underline = font.underline
         try:
             self.caps = TEXT_CAPS_VALUES(font._element.attrib['cap'])
@@ -87,21 +149,19 @@ class PPTXFontStyle:
 
     def write_font(self, font: Font) -> None:
         """Write attributes to a pptx.text.text.Font object."""
-        font.name = self._get_write_value(new_value=self.name, old_value=font.name)
-        font.bold = self._get_write_value(new_value=self.bold, old_value=font.bold)
-        font.italic = self._get_write_value(new_value=self.italic, old_value=font.italic)
-        font.underline = self._get_write_value(new_value=self.underline, old_value=font.underline)
+        self._write_font(font, self._get_write_plan())
 
-        if self.language_id == _USE_DEFAULT:
-            font.language_id = MSO_LANGUAGE_ID.NONE
-        else:
-            font.language_id = self._get_write_value(new_value=self.language_id, old_value=font.language_id)
+    def _write_font(self, font: Font, plan: Tuple[Tuple[str, any], ...]) -> None:
+        """write_font() with an already resolved write plan (see _get_write_plan)."""
+        _g = self._get_write_value
+        font.name = _g(self.name, font.name)
+        for attribute, value in plan:
+            setattr(font, attribute, value)
 
-        if self.size is not None:
-            if self.size == _USE_DEFAULT:
-                font.size = None
-            else:
-                font.size = Pt(self.size)
+        if self.language_id is _USE_DEFAULT:
+            font.language_id = _MSO_LANG_NONE
+        else:
+            font.language_id = _g(self.language_id, font.language_id)
 
         if self.color_rgb is not None:
             font.color.rgb = self.color_rgb
@@ -112,6 +172,20 @@ class PPTXFontStyle:
         self._write_caps(font)
         self._write_strikethrough(font)
 
+    def _get_write_plan(self) -> Tuple[Tuple[str, any], ...]:
+        """
+        Returns the (attribute, value) pairs for bold, italic, underline and size that write_font() has to set.
+        None (do not change) is skipped and use_default() is mapped to None. name and language_id are not part
+        of the plan, as their defaults are class attributes, that might be changed without notice.
+        """
+        if self._plan_dirty:
+            size = self._size_emu if self._size is not _USE_DEFAULT else _USE_DEFAULT
+            values = (('bold', self._bold), ('italic', self._italic), ('underline', self._underline), ('size', size))
+            self._plan = tuple((attribute, None if value is _USE_DEFAULT else value)
+                               for attribute, value in values if value is not None)
+            self._plan_dirty = False
+        return self._plan
+
     def _write_caps(self, font: Font):
         if self.caps is None:
             return
@@ -127,11 +201,7 @@ class PPTXFontStyle:
     @staticmethod
     def _get_write_value(new_value, old_value, check_default=True):
         """Used to check for None and use_default(), returning the correct value to write."""
-        if new_value is None:
-            return old_value
-        if check_default and (new_value == _USE_DEFAULT):
-            return None
-        return new_value
+        return old_value if new_value is None else (None if check_default and new_value is _USE_DEFAULT else new_value)
 
     def write_shape(self, shape: Shape) -> None:
         """
@@ -151,8 +221,12 @@ class PPTXFontStyle:
         """
         Write attributes to all paragraphs in given text_frame.
         """
-        for paragraph in text_frame.paragraphs:
-            self.write_paragraph(paragraph)
+        # same as write_paragraph() for each paragraph, but the write plan is resolved only once per text_frame
+        fonts = [paragraph.font for paragraph in text_frame.paragraphs]
+        plan = self._get_write_plan()
+        _write_font = self._write_font
+        for font in fonts:
+            _write_font(font, plan)
 
     def write_paragraph(self, paragraph: _Paragraph) -> None:
         """ Write attributes to given paragraph"""
@@ -173,23 +247,24 @@ class PPTXFontStyle:
             strikethrough: Optional[TEXT_STRIKE_VALUES] = _DO_NOT_CHANGE
             ) -> 'PPTXFontStyle':
         """Convenience method to set several paragraph attributes together."""
-        if bold is not _DO_NOT_CHANGE:
+        _NC = _DO_NOT_CHANGE
+        if bold is not _NC:
             self.bold = bold
-        if italic is not _DO_NOT_CHANGE:
+        if italic is not _NC:
             self.italic = italic
-        if language_id is not _DO_NOT_CHANGE:
+        if language_id is not _NC:
             self.language_id = language_id
-        if name is not _DO_NOT_CHANGE:
+        if name is not _NC:
             self.name = name
-        if size is not _DO_NOT_CHANGE:
+        if size is not _NC:
             self.size = size
-        if underline is not _DO_NOT_CHANGE:
+        if underline is not _NC:
             self.underline = underline
-        if color_rgb is not _DO_NOT_CHANGE:
+        if color_rgb is not _NC:
             self.color_rgb = color_rgb
-        if caps is not _DO_NOT_CHANGE:
+        if caps is not _NC:
             self.caps = caps
-        if strikethrough is not _DO_NOT_CHANGE:
+        if strikethrough is not _NC:
             self.strikethrough = strikethrough
         return self
 
@@ -206,3 +281,19 @@ class PPTXFontStyle:
     #         paragraph._element.attrib['strike'] = "sngStrike"
     #     else:
     #         pass
+
+
+class _FrozenFontStyle(_ReadOnlyStyle, PPTXFontStyle):
+    """Read-only PPTXFontStyle, used for DEFAULT_FONT_STYLE."""
+    __slots__ = ('_frozen',)
+    _display_name = "DEFAULT_FONT_STYLE"
+    _mutable_class = PPTXFontStyle
+
+    def __init__(self):
+        super().__init__()
+        self._get_write_plan()  # resolve the write plan now; it cannot be stored after freezing
+        self._freeze()
+
+
+# shared style with all attributes unset; use DEFAULT_FONT_STYLE.copy() to get a modifiable style
+DEFAULT_FONT_STYLE = _FrozenFontStyle()
@@ -43,15 +43,16 @@ class PPTXParagraphStyle:
             space_after: Optional[float] = _DO_NOT_CHANGE
             ) -> 'PPTXParagraphStyle':
         """Convenience method to set several paragraph attributes together."""
-        if alignment is not _DO_NOT_CHANGE:
+        _NC = _DO_NOT_CHANGE
+        if alignment is not _NC:
             self.alignment = alignment
-        if level is not _DO_NOT_CHANGE:
+        if level is not _NC:
             self.level = level
-        if line_spacing is not _DO_NOT_CHANGE:
+        if line_spacing is not _NC:
             self.line_spacing = line_spacing
-        if space_before is not _DO_NOT_CHANGE:
+        if space_before is not _NC:
             self.space_before = space_before
-        if space_after is not _DO_NOT_CHANGE:
+        if space_after is not _NC:
             self.space_after = space_after
         return self
 
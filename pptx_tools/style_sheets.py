@@ -6,7 +6,7 @@ paragraph styles in your project, you should create a customized version.
 from pptx.util import Inches
 
 from pptx_tools.fill_style import FillType
-from pptx_tools.font_style import PPTXFontStyle
+from pptx_tools.font_style import PPTXFontStyle, DEFAULT_FONT_STYLE
 from pptx_tools.paragraph_style import PPTXParagraphStyle
 # from pptx.enum.lang import MSO_LANGUAGE_ID
 from pptx.enum.text import PP_PARAGRAPH_ALIGNMENT
@@ -42,7 +42,7 @@ def table_no_header() -> PPTXTableStyle:
 
 
 def font_default() -> PPTXFontStyle:  # paragraph for normal text
-    result = PPTXFontStyle()
+    result = DEFAULT_FONT_STYLE.copy()
     # result.language_id = MY_DEFAULT_LANGUAGE
     # result.name = MY_DEFAULT_FONT_NAME
     result.size = 14
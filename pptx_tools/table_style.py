@@ -10,13 +10,13 @@ from pptx.util import Inches
 
 from pptx_tools.font_style import PPTXFontStyle
 from pptx_tools.position import PPTXPosition
-from pptx_tools.fill_style import PPTXFillStyle
+from pptx_tools.fill_style import DEFAULT_FILL_STYLE
 from pptx_tools.utils import iter_table_cells, _DO_NOT_CHANGE
 
 
 class PPTXCellStyle:  # format table cell
     def __init__(self):
-        self.fill_style = PPTXFillStyle()
+        self.fill_style = DEFAULT_FILL_STYLE.copy()
 
     def write_cell(self, cell: _Cell) -> None:
         self.fill_style.write_fill(cell.fill)
@@ -58,21 +58,22 @@ class PPTXTableStyle:
             position: Optional[PPTXPosition] = _DO_NOT_CHANGE
             ) -> 'PPTXTableStyle':
         """Convenience method to set several table attributes together."""
-        if font_style is not _DO_NOT_CHANGE:
+        _NC = _DO_NOT_CHANGE
+        if font_style is not _NC:
             self.font_style = font_style
-        if cell_style is not _DO_NOT_CHANGE:
+        if cell_style is not _NC:
             self.cell_style = cell_style
-        if first_row_header is not _DO_NOT_CHANGE:
+        if first_row_header is not _NC:
             self.first_row_header = first_row_header
-        if col_banding is not _DO_NOT_CHANGE:
+        if col_banding is not _NC:
             self.col_banding = col_banding
-        if row_banding is not _DO_NOT_CHANGE:
+        if row_banding is not _NC:
             self.row_banding = row_banding
-        if width is not _DO_NOT_CHANGE:
+        if width is not _NC:
             self.width = width
-        if col_ratios is not _DO_NOT_CHANGE:
+        if col_ratios is not _NC:
             self.col_ratios = col_ratios
-        if position is not _DO_NOT_CHANGE:
+        if position is not _NC:
             self.position = position
         return self
 
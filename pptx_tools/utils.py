@@ -14,6 +14,7 @@ except:
     has_comptypes=False
 
 import pptx
+from pptx.enum.dml import MSO_COLOR_TYPE, MSO_FILL
 from pptx.table import Table, _Cell
 import tempfile
 
@@ -52,10 +53,45 @@ class _USE_DEFAULT:  # using a class allows typing
                "changed when calling PPTXFontStyle.write_font(). But to remove a customized paragraph size, e.g. in a run, " \
                "the value has to be set to None in python-pptx. Thats done with 'PPTXFontStyle.size = use_default'."
 
-class _DO_NOT_CHANGE:
+class _DO_NOT_CHANGE:  # set() methods bind it to a local _NC, to avoid a global lookup per argument
     def __str__(self):
         return """used to tell PPTXFontStyle.set() / PPTXParagraphStyle.set() ... to not change a value"""
 
+class _ReadOnlyStyle:
+    """
+    Mixin for the shared default styles (DEFAULT_FONT_STYLE, ...). Attributes cannot be changed after _freeze().
+    Subclasses add a '_frozen' slot, set _display_name to the name of their module level instance and
+    _mutable_class to the style class returned by copy(). Copies and pickles resolve to that same instance.
+    """
+    __slots__ = ()
+    _display_name: str = ""
+    _mutable_class: type = None
+
+    def copy(self):
+        """Returns a modifiable copy (instance of _mutable_class)."""
+        return self._copy_into(self._mutable_class.__new__(self._mutable_class))
+
+    def _freeze(self) -> None:
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_frozen', False):
+            raise AttributeError(f"{self._display_name} is read-only; use {self._display_name}.copy() instead.")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self._display_name} is read-only; use {self._display_name}.copy() instead.")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return self._display_name  # pickled as reference to the module level instance
+
+
 def use_default():
     return _USE_DEFAULT
 
@@ -73,19 +109,42 @@ def change_paragraph_text_to(paragraph, text):
     :param text:
     :return:
     """
-    from pptx_tools.font_style import PPTXFontStyle  # local import to prevent circle import error
-    font = PPTXFontStyle()
+    from pptx_tools.font_style import DEFAULT_FONT_STYLE  # local import to prevent circle import error
+    font = DEFAULT_FONT_STYLE.copy()
     font.read_font(paragraph.runs[0].font)
     paragraph.text = text
     font.write_paragraph(paragraph)
 
 
 def copy_font(_from: 'Font', _to: 'Font') -> None:
-    """Copies settings from one pptx.text.text.Font to another."""
-    from pptx_tools.font_style import PPTXFontStyle  # local import to prevent circle import error
-    font_style = PPTXFontStyle()
-    font_style.read_font(_from)
-    font_style.write_font(_to)
+    """
+    Copies settings from one pptx.text.text.Font to another. bold, italic, name, underline and language_id are
+    copied as they are (including None -> inherited); size, solid color (rgb or theme, including brightness), caps and
+    strikethrough only when set in _from.
+    """
+    _to.bold = _from.bold
+    _to.italic = _from.italic
+    _to.name = _from.name
+    size = _from.size
+    if size is not None:
+        _to.size = size
+    _to.underline = _from.underline
+    _to.language_id = _from.language_id
+
+    if _from.fill.type == MSO_FILL.SOLID:  # check fill first - Font.color would add a solid fill to _from
+        color = _from.color
+        if color.type == MSO_COLOR_TYPE.RGB:
+            _to.color.rgb = color.rgb
+        elif color.type == MSO_COLOR_TYPE.SCHEME:
+            _to.color.theme_color = color.theme_color
+        if color.type is not None and color.brightness:
+            _to.color.brightness = color.brightness
+
+    from_attrib = _from._element.attrib
+    to_attrib = _to._element.attrib
+    for key in ('cap', 'strike'):  # experimental attributes, see PPTXFontStyle.caps/strikethrough
+        if key in from_attrib:
+            to_attrib[key] = from_attrib[key]
 
 # ----------------------------------------------------------------------------------------------------------------------
 # The following functions need an installed PowerPoint and will only work on windows systems.
@@ -0,0 +1,111 @@
+"""
+This file contains tests for PPTXFillStyle-methods.
+@author: Nathanael Jöhrmann
+"""
+import copy
+import logging
+import pickle
+from collections import namedtuple
+
+import pytest
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_THEME_COLOR, MSO_FILL
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.util import Inches
+
+from pptx_tools.fill_style import PPTXFillStyle, FillType, DEFAULT_FILL_STYLE
+from pptx_tools.font_style import PPTXFontStyle
+
+
+@pytest.fixture
+def shape_fill():
+    presentation = Presentation()
+    slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+    shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, Inches(1), Inches(1))
+    yield shape.fill
+
+
+class _MyRGBColor(RGBColor):
+    pass
+
+
+class TestPPTXFillStyle:
+    @pytest.mark.parametrize("value", [namedtuple('Color', 'r g b')(1, 2, 3), _MyRGBColor(1, 2, 3)])
+    def test_color_rgb_accepts_tuple_subclasses(self, value):
+        fill_style = PPTXFillStyle()
+        fill_style.fore_color_rgb = value
+        fill_style.back_color_rgb = value
+        font_style = PPTXFontStyle()
+        font_style.color_rgb = value
+        for result in (fill_style.fore_color_rgb, fill_style.back_color_rgb, font_style.color_rgb):
+            assert isinstance(result, RGBColor)
+            assert result == (1, 2, 3)
+
+    def test_color_rgb_validation_does_not_depend_on_cache(self):
+        fill_style = PPTXFillStyle()
+        fill_style.fore_color_rgb = (1, 2, 3)
+        with pytest.raises(ValueError):  # RGBColor() only takes int values
+            fill_style.fore_color_rgb = (1.0, 2.0, 3.0)
+
+    def test_color_rgb_unhashable_values_validated_by_rgb_color(self):
+        fill_style = PPTXFillStyle()
+        with pytest.raises(ValueError):  # from RGBColor(), not from the lru_cache key
+            fill_style.fore_color_rgb = ([1], 2, 3)
+
+    def test_color_rgb_rejects_other_types(self):
+        fill_style = PPTXFillStyle()
+        with pytest.raises(TypeError):
+            fill_style.fore_color_rgb = [1, 2, 3]
+
+    def test_back_color_rgb_keeps_fore_color_mso_theme(self, shape_fill):
+        fill_style = PPTXFillStyle()
+        fill_style.set(fill_type=FillType.PATTERNED, fore_color_mso_theme=MSO_THEME_COLOR.ACCENT_1)
+        fill_style.back_color_mso_theme = MSO_THEME_COLOR.ACCENT_2
+        fill_style.back_color_rgb = (1, 2, 3)
+        assert fill_style.fore_color_mso_theme == MSO_THEME_COLOR.ACCENT_1
+        assert fill_style.back_color_mso_theme is None
+
+        fill_style.write_fill(shape_fill)
+        assert shape_fill.type == MSO_FILL.PATTERNED
+        assert shape_fill.fore_color.theme_color == MSO_THEME_COLOR.ACCENT_1
+        assert shape_fill.back_color.rgb == (1, 2, 3)
+
+    @pytest.mark.parametrize("fill_type", [MSO_FILL.SOLID, "SOLID", ["SOLID"]])  # not a FillType
+    def test_write_fill_rejects_invalid_fill_type(self, shape_fill, fill_type):
+        fill_style = PPTXFillStyle()
+        fill_style.fill_type = fill_type
+        with pytest.raises(ValueError):
+            fill_style.write_fill(shape_fill)
+
+    def test_default_fill_style_is_read_only(self):
+        with pytest.raises(AttributeError):
+            DEFAULT_FILL_STYLE.fill_type = FillType.SOLID
+        with pytest.raises(AttributeError):
+            DEFAULT_FILL_STYLE.fore_color_rgb = (1, 2, 3)
+        assert DEFAULT_FILL_STYLE.fill_type is None and DEFAULT_FILL_STYLE.fore_color_rgb is None
+
+        result = DEFAULT_FILL_STYLE.copy()
+        assert type(result) is PPTXFillStyle
+        result.set(fill_type=FillType.SOLID, fore_color_rgb=(1, 2, 3))
+        assert result.fill_type is FillType.SOLID and result.fore_color_rgb == (1, 2, 3)
+
+    def test_default_fill_style_copy(self):
+        assert copy.copy(DEFAULT_FILL_STYLE) is DEFAULT_FILL_STYLE
+
+    def test_default_fill_style_deepcopy(self):
+        assert copy.deepcopy(DEFAULT_FILL_STYLE) is DEFAULT_FILL_STYLE
+        assert copy.deepcopy([DEFAULT_FILL_STYLE])[0] is DEFAULT_FILL_STYLE
+
+    def test_default_fill_style_pickle(self):
+        assert pickle.loads(pickle.dumps(DEFAULT_FILL_STYLE)) is DEFAULT_FILL_STYLE
+
+    def test_write_fill_solid_without_fore_color_logs_warning(self, shape_fill, caplog, capsys):
+        fill_style = PPTXFillStyle()
+        fill_style.fill_type = FillType.SOLID
+        with caplog.at_level(logging.WARNING, logger="pptx_tools.fill_style"):
+            fill_style.write_fill(shape_fill)
+
+        records = [record for record in caplog.records if record.name == "pptx_tools.fill_style"]
+        assert [record.levelno for record in records] == [logging.WARNING]
+        assert capsys.readouterr().out == ""
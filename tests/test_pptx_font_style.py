@@ -3,12 +3,20 @@ This file contains tests for PPTXFontStyle-methods. It can be useful to open the
 folder, to also check functionality inside PowerPoint.
 @author: Nathanael Jöhrmann
 """
+import copy
 import os
+import pickle
 
 import pytest
+from pptx import Presentation
+from pptx.util import Inches, Pt, Centipoints
 
 from pptx_tools.creator import PPTXCreator
+from pptx_tools.fill_style import PPTXFillStyle, FillType, DEFAULT_FILL_STYLE
+from pptx_tools.font_style import PPTXFontStyle, DEFAULT_FONT_STYLE
+from pptx_tools.table_style import PPTXTableStyle
 from pptx_tools.templates import TemplateExample
+from pptx_tools.utils import use_default
 
 
 @pytest.fixture(scope='session')
@@ -17,6 +25,16 @@ def pptx_creator():
     yield creator
 
 
+@pytest.fixture
+def text_frame():
+    presentation = Presentation()
+    slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+    result = slide.shapes.add_textbox(0, 0, Inches(1), Inches(1)).text_frame
+    result.text = "first"
+    result.add_paragraph().text = "second"
+    yield result
+
+
 class TestPPTXFontStyle:
     def test_color_rgb(self):
         assert False
@@ -30,6 +48,31 @@ class TestPPTXFontStyle:
     def test_write_font(self):
         assert False
 
+    def test_write_font_after_change(self, text_frame):
+        font_style = PPTXFontStyle().set(bold=True, italic=False, size=12)
+        font_style.write_text_frame(text_frame)
+        for paragraph in text_frame.paragraphs:
+            assert (paragraph.font.bold, paragraph.font.italic, paragraph.font.size) == (True, False, Pt(12))
+
+        font_style.bold = False
+        font_style.size = 20
+        font_style.write_text_frame(text_frame)
+        for paragraph in text_frame.paragraphs:
+            assert (paragraph.font.bold, paragraph.font.italic, paragraph.font.size) == (False, False, Pt(20))
+
+        font_style.set(bold=use_default(), italic=None, size=use_default())
+        font_style.write_font(text_frame.paragraphs[0].font)
+        font = text_frame.paragraphs[0].font
+        assert (font.bold, font.italic, font.size) == (None, False, None)
+
+    def test_read_font_write_font_keeps_exact_size(self, text_frame):
+        source, target = (paragraph.font for paragraph in text_frame.paragraphs)
+        source.size = Centipoints(829)  # Pt(8.29) would give a different EMU value
+        font_style = PPTXFontStyle().read_font(source)
+        assert font_style.size == source.size.pt
+        font_style.write_font(target)
+        assert target.size == Centipoints(829)
+
     def test__write_caps(self):
         assert False
 
@@ -54,6 +97,65 @@ class TestPPTXFontStyle:
     def test_set(self):
         assert False
 
+    def test_copy(self):
+        fill_style = PPTXFillStyle()
+        fill_style.set(fill_type=FillType.SOLID, fore_color_rgb=(10, 20, 30))
+        font_style = DEFAULT_FONT_STYLE.copy().set(bold=True, size=12, name="Arial", color_rgb=(1, 2, 3))
+        font_style.fill_style = fill_style
+
+        result = font_style.copy()
+        assert (result.bold, result.size, result.name, result.color_rgb) == (True, 12, "Arial", (1, 2, 3))
+        assert result.fill_style is not fill_style
+        assert result.fill_style.fore_color_rgb == (10, 20, 30)
+
+        result.set(size=14, name="Roboto")
+        assert font_style.size == 12 and font_style.name == "Arial"
+        assert DEFAULT_FONT_STYLE.bold is None and DEFAULT_FONT_STYLE.size is None
+
+    def test_default_font_style_is_read_only(self, text_frame):
+        with pytest.raises(AttributeError):
+            DEFAULT_FONT_STYLE.set(size=20)
+        with pytest.raises(AttributeError):
+            DEFAULT_FONT_STYLE.name = "Arial"
+        assert DEFAULT_FONT_STYLE.size is None and "name" not in DEFAULT_FONT_STYLE.__dict__
+
+        DEFAULT_FONT_STYLE.write_text_frame(text_frame)  # writing does not change the style
+        result = DEFAULT_FONT_STYLE.copy()
+        assert type(result) is PPTXFontStyle
+        result.set(size=20, name="Arial")
+        assert result.size == 20 and result.name == "Arial"
+
+    def test_copy_keeps_subclass(self):
+        class MyFillStyle(PPTXFillStyle):
+            __slots__ = ()
+
+        class MyFontStyle(PPTXFontStyle):
+            __slots__ = ()
+
+        font_style = MyFontStyle().set(bold=True)
+        font_style.fill_style = MyFillStyle()
+        result = font_style.copy()
+        assert type(result) is MyFontStyle and result.bold is True
+        assert type(result.fill_style) is MyFillStyle
+
+        font_style.fill_style = DEFAULT_FILL_STYLE
+        assert type(font_style.copy().fill_style) is PPTXFillStyle
+
+    def test_default_font_style_copy(self):
+        assert copy.copy(DEFAULT_FONT_STYLE) is DEFAULT_FONT_STYLE
+
+    def test_default_font_style_deepcopy(self):
+        table_style = PPTXTableStyle()
+        table_style.font_style = DEFAULT_FONT_STYLE
+        assert copy.deepcopy(DEFAULT_FONT_STYLE) is DEFAULT_FONT_STYLE
+        assert copy.deepcopy(table_style).font_style is DEFAULT_FONT_STYLE
+
+    def test_default_font_style_pickle(self):
+        table_style = PPTXTableStyle()
+        table_style.font_style = DEFAULT_FONT_STYLE
+        assert pickle.loads(pickle.dumps(DEFAULT_FONT_STYLE)) is DEFAULT_FONT_STYLE
+        assert pickle.loads(pickle.dumps(table_style)).font_style is DEFAULT_FONT_STYLE
+
 def test_save_test_results_as_temp_pptx_file(pptx_creator, tmpdir):
     file = tmpdir.join("test_font_style.pptx")
     pptx_creator.save(file)
@@ -1,7 +1,14 @@
 """
 @author: Nathanael Jöhrmann
 """
-from pptx_tools.utils import use_default, _USE_DEFAULT
+import pytest
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.enum.lang import MSO_LANGUAGE_ID
+from pptx.util import Inches, Pt
+
+from pptx_tools.utils import use_default, _USE_DEFAULT, copy_font
 
 
 def test_use_default():
@@ -16,8 +23,41 @@ def test_change_paragraph_text_to():
     assert False
 
 
-def test_copy_font():
-    assert False
+@pytest.fixture
+def fonts():
+    presentation = Presentation()
+    slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+    text_frame = slide.shapes.add_textbox(0, 0, Inches(1), Inches(1)).text_frame
+    for _ in range(3):
+        text_frame.add_paragraph()
+    yield [paragraph.font for paragraph in text_frame.paragraphs]
+
+
+def test_copy_font(fonts):
+    _from, _to, _empty, _target = fonts
+    _from.bold = True
+    _from.size = Pt(14)
+    _from.language_id = MSO_LANGUAGE_ID.GERMAN
+    _from.color.rgb = RGBColor(1, 2, 3)
+    _from._element.attrib['cap'] = 'all'
+    _from._element.attrib['strike'] = 'sngStrike'
+    _to.italic = True
+    _to.name = "Arial"
+
+    copy_font(_from, _to)
+    assert (_to.bold, _to.italic, _to.name) == (True, None, None)  # None in _from overwrites _to
+    assert (_to.size, _to.language_id, _to.color.rgb) == (Pt(14), MSO_LANGUAGE_ID.GERMAN, (1, 2, 3))
+    assert (_to._element.attrib['cap'], _to._element.attrib['strike']) == ('all', 'sngStrike')
+
+    _target.size = Pt(20)
+    copy_font(_empty, _target)
+    assert _target.size == Pt(20)  # size kept when _from.size is None
+    assert _empty.fill.type is None  # reading _from did not add a solidFill
+
+    _from.color.theme_color = MSO_THEME_COLOR.ACCENT_2
+    _from.color.brightness = 0.4
+    copy_font(_from, _target)
+    assert (_target.color.theme_color, _target.color.brightness) == (MSO_THEME_COLOR.ACCENT_2, 0.4)
 
 
 def test_save_pptx_as_png():